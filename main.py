@@ -1,8 +1,13 @@
 import os
 
+from array import array
 from collections import defaultdict
-from copy import copy
-from sys import getrecursionlimit, setrecursionlimit
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from heapq import heapify, heappop, heappush
+from itertools import repeat
+from multiprocessing import freeze_support
 from time import time
 from textwrap import dedent
 
@@ -39,8 +44,43 @@ class LosslessCompressor:
 
 		'''
 		#### Info
-		Compresses the file at the `path` perameter using the specified `mode` and saves it to the `compressed/` folder <br>
-		Prints details about the output;
+		Compresses every file in `input_folder` and saves them as .llc (.losslesscompressed) files to `output_folder` <br>
+		Each file is compressed independently, so when there is more than one they are compressed in parallel across processes (see `compress_file`); their details are printed in input order once each file is done
+
+		#### Perameters
+		- `input_folder: str` - the folder containing the files to compress
+		- `output_folder: str` - the folder to save the compressed files to
+
+		#### Returns
+		- (Nothing - the output is saved to `output_folder` automatically)
+		'''
+
+		paths_to_compress = [input_folder + "\\" + path for path in os.listdir(input_folder)]
+		output_paths = [f'{output_folder}\\{os.path.splitext(os.path.basename(path))[0]}.llc' for path in paths_to_compress]
+
+		# a single file is compressed in this process, skipping the cost of starting the pool
+		if len(paths_to_compress) < 2:
+
+			for path, output_path in zip(paths_to_compress, output_paths):
+
+				print(f'\ncompressing {path} -> {output_path};')
+				print(self.compress_file(path, output_path))
+
+			return
+
+		with ProcessPoolExecutor() as executor:
+
+			for path, output_path, summary in zip(paths_to_compress, output_paths, executor.map(self.compress_file, paths_to_compress, output_paths)):
+
+				print(f'\ncompressing {path} -> {output_path};')
+				print(summary)
+
+	def compress_file(self, path: str, output_path: str) -> str:
+
+		'''
+		#### Info
+		Compresses the file at `path` and saves it to `output_path` <br>
+		Returns details about the output (rather than printing them, so they stay in order when files are compressed in parallel);
 		- time taken
 		- % compression (bytes + chars)
 		- file size (new vs original) - bytes
@@ -48,10 +88,10 @@ class LosslessCompressor:
 
 		#### Perameters
 		- `path: str` - the path of the file to compress
-		- `mode: int (0 or 1)` - `0` = priotise file size when compressing; `1` = prioritise number of characters
+		- `output_path: str` - the path to save the compressed file to
 
 		#### Returns
-		- (Nothing - the output is saved to the `compressed/` folder automatically)
+		- `str` - the compression details to print
 		'''
 
 		# SUBFUNCTIONS
@@ -74,38 +114,155 @@ class LosslessCompressor:
 			lookup_output = self.lookup_delimeter.join([item[0] + item[1] for item in lookup.items()]) # joins each key and chunk together, and joins them with self.lookup_delimeter
 			return lookup_output + (self.text_delimeter if lookup else '') + text
 
-		def gen_hash_table(text: str, chunk_len: int) -> defaultdict[str, list[int]]:
+		def gen_hash_table(text: str, chunk_len: int) -> tuple[list[int], defaultdict[int, array]]:
 
 			'''
 			#### Info
 			Generates a super-fast lookup dictionary containing all chunks of len `chunk_len` in `text` and their indexes. <br>
+			Each chunk is packed into a single integer hash (21 bits per character - enough for any unicode code point), so no substrings are sliced and keys hash + compare as plain integers.
 
 			#### Perameters
 			- `text: str` - the text of which to analyse chunks and their indexes
 			- `chunk_len: int` - the length of chunks analysed in the text
 
 			#### Returns	 
-			- `defaultdict[str, list[int]]` - a dictionary whose keys are the chunks, and the values their indexes (`chunk_indexes: list = outputted_dict[chunk: str]`)
+			- `tuple[` <br>
+			  `    list[int],` - the hash of the chunk starting at each index of `text` <br>
+			  `    defaultdict[int, array]` - a dictionary whose keys are the chunk hashes, and the values their indexes (`chunk_indexes: array = outputted_dict[hashes[chunk_index]]`) <br>
+			  `]`
 			'''
 
-			hash_table = defaultdict(list)
+			codes = [ord(char) for char in text]
+
+			# packs each chunk's characters into one int, a whole column of chunks at a time
+			hashes = codes[:len(codes) - chunk_len + 1]
+			for offset in range(1, chunk_len):
+				hashes = [(chunk_hash << 21) | code for chunk_hash, code in zip(hashes, codes[offset:])]
 
-			for i in range(len(text) - chunk_len + 1):
+			hash_table = defaultdict(partial(array, 'l')) # indexes are stored as raw C longs rather than a list of int objects (~4x less memory)
 
-				chunk = text[i:i + chunk_len]
-				hash_table[chunk].append(i)
+			for i, chunk_hash in enumerate(hashes):
+				hash_table[chunk_hash].append(i)
 				
-			return hash_table
+			return hashes, hash_table
+
+		def gen_common_len(text: str, chunk_indexes: list[int], matched_len: int) -> int:
+
+			'''
+			#### Info
+			Finds the longest common extension of the chunks starting at every one of `chunk_indexes` in `text` (the length of the longest chunk that appears at all of them). <br>
+			Doubles the length while the chunks still match, then binary searches the last doubling step. Each step checks every index in one C-level pass (`all` over `map(str.startswith, ...)`, stopping at the first mismatch), rather than one Python call per index.
+
+			#### Perameters
+			- `text: str` - the text containing the chunks
+			- `chunk_indexes: list[int]` - the start indexes of the chunks, in ascending order
+			- `matched_len: int` - a length already known to match at every index
+
+			#### Returns
+			- `int` - the number of characters that match from every index onwards
+			'''
+
+			chunk_index, *duplicate_indexes = chunk_indexes
+			max_len = len(text) - chunk_indexes[-1]
+			low, high = matched_len, matched_len * 2 # low always matches; high is the first length not known to
+
+			while high <= max_len and all(map(text.startswith, repeat(text[chunk_index: chunk_index + high]), duplicate_indexes)):
+				low, high = high, high * 2
+
+			high = min(high, max_len + 1)
+
+			while high - low > 1:
+
+				mid = (low + high) // 2
+				if all(map(text.startswith, repeat(text[chunk_index: chunk_index + mid]), duplicate_indexes)): low = mid
+				else: high = mid
+
+			return low
 
-		def compress(prev_text: str, prev_lookup: dict) -> tuple[str, dict[str, str]]:
+		def gen_chunk(text: str, hashes: list[int], chunk_indexes: Sequence[int], chunk_len: int) -> tuple[str, Sequence[int]]:
 
 			'''
 			#### Info
-			- The recursive compression algorithm function that creates lossless compression.
+			Extends the chunk at the first of `chunk_indexes` as far as every duplicate that matches it for more than `chunk_len` chars still matches.
 
 			#### Perameters
-			- `prev_text: str`: the previous compressed / decompressed text to be compressed again
-			- `prev_lookup: str`: the previous lookup dictionary to be extended
+			- `text: str` - the text containing the chunk
+			- `hashes: list[int]` - the hash of the chunk starting at each index of `text` (from `gen_hash_table`)
+			- `chunk_indexes: Sequence[int]` - the indexes of the chunk and its duplicates, in ascending order
+			- `chunk_len: int` - the length of the hashed chunks
+
+			#### Returns
+			- `tuple[` <br>
+			  `    str,` - the extended chunk <br>
+			  `    Sequence[int]` - the indexes the extended chunk appears at, in ascending order <br>
+			  `]`
+			'''
+
+			chunk_index, *duplicate_indexes = chunk_indexes
+
+			# filters out duplicates that can't be extended with one integer compare each (the chunk one char along must have the same hash), before any slice compares
+			next_hash = hashes[chunk_index + 1] if chunk_index + 1 < len(hashes) else None
+			extendable_indexes = [i for i in duplicate_indexes if i + 1 < len(hashes) and hashes[i + 1] == next_hash]
+
+			if not extendable_indexes: return text[chunk_index: chunk_index + chunk_len], chunk_indexes
+
+			# extends chunk len as far as every extendable duplicate still matches
+			chunk_indexes = [chunk_index] + extendable_indexes
+			common_len = gen_common_len(text = text, chunk_indexes = chunk_indexes, matched_len = chunk_len + 1)
+			return text[chunk_index: chunk_index + common_len], chunk_indexes
+
+		def gen_replace_count(chunk_indexes: Sequence[int], chunk_len: int) -> int:
+
+			'''
+			#### Info
+			Counts how many times a chunk would be replaced by `str.replace`, given every index it appears at (overlapping chunks are only replaced once, left to right).
+
+			#### Perameters
+			- `chunk_indexes: Sequence[int]` - the indexes the chunk appears at, in ascending order
+			- `chunk_len: int` - the length of the chunk
+
+			#### Returns
+			- `int` - the number of non-overlapping occurrences of the chunk
+			'''
+
+			count = 0
+			chunk_end = 0
+
+			for i in chunk_indexes:
+				if i >= chunk_end: count, chunk_end = count + 1, i + chunk_len
+
+			return count
+
+		def gen_next_key_code(key_code: int) -> int:
+
+			'''
+			#### Info
+			Returns the code point after `key_code` to use as the next key. <br>
+			Skips the surrogates (U+D800 - U+DFFF), as they can't be encoded as UTF-8 when the output is saved.
+
+			#### Perameters
+			- `key_code: int` - the code point of the last key used
+
+			#### Returns
+			- `int` - the code point of the next key (above `0x10FFFF` once every unicode char has been used)
+			'''
+
+			key_code += 1
+			if 0xD800 <= key_code <= 0xDFFF: key_code = 0xE000
+
+			return key_code
+
+		def compress(text: str, lookup: dict[str, str]) -> tuple[str, dict[str, str]]:
+
+			'''
+			#### Info
+			- The iterative compression algorithm function that creates lossless compression.
+			- Keeps replacing the chunk that saves the most bytes with a new key until no chunk would make the output smaller, so every step increases the % compression.
+			- The hash table is only rebuilt once every chunk scored from it has been replaced or ruled out.
+
+			#### Perameters
+			- `text: str`: the text to be compressed
+			- `lookup: dict[str, str]`: the lookup dictionary to be extended
 
 			#### Returns
 			- `tuple[` <br>
@@ -114,115 +271,125 @@ class LosslessCompressor:
 			  `]`
 			'''
 
-			text = copy(prev_text)
-			lookup = copy(prev_lookup)
+			text_delimeter_size = len(self.text_delimeter.encode())
+			lookup_delimeter_size = len(self.lookup_delimeter.encode())
 
 			chunk_len = 2
-			hash_table = gen_hash_table(text = text, chunk_len = chunk_len)
+			key_code = gen_next_key_code(ord(self.lookup_key_prefix)) # keys count up from the char after the prefix
+			if key_code > 0x10FFFF: return text, lookup # no chars left to use as keys
+
+			# the next key + its sizes only change when a chunk is replaced, so they're kept up to date there rather than re-encoded for every candidate
+			key = chr(key_code)
+			key_size = len(key.encode())
+			entry_size = (lookup_delimeter_size if lookup else text_delimeter_size) + key_size # lookup output bytes added on top of the chunk itself
+
+			while True:
+
+				hashes, hash_table = gen_hash_table(text = text, chunk_len = chunk_len)
+
+				# scores every chunk that has duplicates by how many bytes replacing it would save
+				candidates = []
+
+				for chunk_indexes in hash_table.values():
+
+					if len(chunk_indexes) < 2: continue
+
+					chunk, chunk_indexes = gen_chunk(text = text, hashes = hashes, chunk_indexes = chunk_indexes, chunk_len = chunk_len)
+					chunk_count = gen_replace_count(chunk_indexes = chunk_indexes, chunk_len = len(chunk))
+					chunk_size = len(chunk.encode())
+					savings = chunk_count * (chunk_size - key_size) - entry_size - chunk_size
+
+					if savings <= 0: continue # replacing it wouldn't make the output any smaller (incl. chunks that only repeat by overlapping themselves), and its savings can only go down from here
+
+					candidates.append((-savings, chunk_indexes[0], chunk, chunk_size, chunk_count, len(lookup)))
+
+				if not candidates: return text, lookup # no more chunks worth replacing
+
+				# replaces the candidates best first (the first one if tied), re-scoring each against the current text as it comes off the heap, then rebuilds the hash table to find chunks made of the new keys
+				# (a replacement can only remove occurrences of other chunks, and keys only get bigger, so a score from an older text is never too low)
+				heapify(candidates)
+
+				while candidates:
+
+					_, chunk_index, chunk, chunk_size, chunk_count, counted_at = heappop(candidates)
+
+					# only recounts the chunk if the text has changed since it was last counted (each candidate remembers the lookup len it was counted at)
+					if counted_at != len(lookup): chunk_count = text.count(chunk)
+
+					savings = chunk_count * (chunk_size - key_size) - entry_size - chunk_size
+					if savings <= 0: continue # no longer worth replacing
+
+					# puts it back if its new score has dropped below the next best candidate's
+					if candidates and -candidates[0][0] > savings:
+						heappush(candidates, (-savings, chunk_index, chunk, chunk_size, chunk_count, len(lookup)))
+						continue
 
-			for chunk_index in range(len(text) - chunk_len + 1): # loops through every chunk index
-				
-				chunk = text[chunk_index: chunk_index + chunk_len]
-				duplicate_indexes = [i for i in hash_table.get(chunk, []) if i != chunk_index]
-			
-				if duplicate_indexes: # if chunk has duplicates -> continue, else skip to next chunk len
-					
-					key = chr(ord(self.lookup_key_prefix) + len(lookup) + 1)
-					# extends chunk len and checks if still same amount of duplicates, until num of duplicates decreases
-					more = True
-					temp_len = chunk_len
-					prev_same_count = 0
-
-					while more:
-						
-						temp_len += 1
-						temp_chunk = text[chunk_index: chunk_index + temp_len]
-						duplicate_indexes = [i for i in duplicate_indexes if text[i: i + temp_len] == temp_chunk]
-
-						if len(duplicate_indexes) >= prev_same_count and duplicate_indexes: chunk = temp_chunk
-						else: more = False
-
-						prev_same_count = len(duplicate_indexes)
-					
 					lookup[key] = chunk # adds char + chunk to lookup dict
 					text = text.replace(chunk, key)
 
-					# generates current output + details
-					output = gen_output(text = text, lookup = lookup) # puts text + lookup into output format
-					output_size = len(output.encode())
-					percent_compression = self.percentage_change(mode = 0, original = input_size, new = output_size)
-
-					# compresses again (extends recursion limit if necessary)
-					try: 
-						text_next, lookup_next = compress(prev_text = text, prev_lookup = lookup)
+					key_code = gen_next_key_code(key_code)
+					if key_code > 0x10FFFF: return text, lookup # no chars left to use as keys
 
-					except RecursionError: 
-						setrecursionlimit(getrecursionlimit() + 1) 
-						text_next, lookup_next = compress(prev_text = text, prev_lookup = lookup)
-				
-					# generates next output + detals
-					output_next = gen_output(text = text_next, lookup = lookup_next)
-					output_size_next = len(output_next.encode())
-					percent_compression_next = self.percentage_change(mode = 0, original = input_size, new = output_size_next)
-
-					print(output_next)
-					
-					# compares current + next output, returns one with higher % compression
-					if percent_compression < 0 and percent_compression_next < 0: return prev_text, prev_lookup
-					if lookup: return ((text, lookup), (text_next, lookup_next))[percent_compression <= percent_compression_next]
-			
-			return prev_text, prev_lookup # no compression found
+					key = chr(key_code)
+					key_size = len(key.encode())
+					entry_size = lookup_delimeter_size + key_size
 		# ------------
 
-		paths_to_compress = [input_folder + "\\" + path for path in os.listdir(input_folder)]
+		summary = []
 
-		for path in paths_to_compress:
+		# retreives input data
+		start_time = time()
+		input_text = self.read_file(path)
 
-			output_path = f'{output_folder}\\{os.path.splitext(os.path.basename(path))[0]}.llc'
+		# input details
+		input_len = len(input_text)
+		input_size = len(input_text.encode())
 
-			print(f'\ncompressing {path} -> {output_path};')
+		# an empty file has nothing to compress (and its % compression would divide by zero)
+		if not input_len:
 
-			# retreives input data
-			start_time = time()
-			input_text = self.read_file(path)
+			self.save_file(output_path, input_text)
+			summary.append(f'compressed successfully ({round(time() - start_time, 3)}s);')
+			summary.append('- (no compresson found)')
+			return '\n'.join(summary)
 
-			# input details
-			input_len = len(input_text)
-			input_size = len(input_text.encode())
-			self.lookup_key_prefix = chr(max([ord(char) for char in input_text]))
-			
-			# compresses input
-			compressed_text, lookup = compress(prev_text = input_text, prev_lookup = {})
-			output_text = gen_output(text = compressed_text, lookup = lookup)
+		self.lookup_key_prefix = max(max(input_text), self.text_delimeter, self.lookup_delimeter) # keys start above every char in the text, and never clash with the delimeters
+		
+		# compresses input
+		compressed_text, lookup = compress(text = input_text, lookup = {})
+		output_text = gen_output(text = compressed_text, lookup = lookup)
 
-			# output details
-			output_len = len(output_text)
-			output_size = len(output_text.encode())
+		# output details
+		output_len = len(output_text)
+		output_size = len(output_text.encode())
 
-			# lookup details
-			lookup_size = len(compressed_text.split(self.text_delimeter)[0].encode()) if lookup else 0
-			lookup_len = len(compressed_text.split(self.text_delimeter)[0]) if lookup else 0
-			lookup_percentage = round(lookup_size / output_size * 100, 2) # choose whether to calculate % lookup as bytes or chars
+		# lookup details
+		lookup_output = output_text.split(self.text_delimeter, 1)[0] if lookup else '' # only scans up to the first delimeter
+		lookup_size = len(lookup_output.encode())
+		lookup_len = len(lookup_output)
+		lookup_percentage = round(lookup_size / output_size * 100, 2) # choose whether to calculate % lookup as bytes or chars
 
-			# % compression
-			percent_compression_bytes = round(self.percentage_change(mode = 0, original = input_size, new = output_size), 1)
-			percent_compression_chars = round(self.percentage_change(mode = 0, original = input_len, new = output_len), 1)
+		# % compression
+		percent_compression_bytes = round(self.percentage_change(mode = 0, original = input_size, new = output_size), 1)
+		percent_compression_chars = round(self.percentage_change(mode = 0, original = input_len, new = output_len), 1)
 
-			self.save_file(output_path, output_text)
+		self.save_file(output_path, output_text)
 
-			# prints compression details
-			print(f'compressed successfully ({round(time() - start_time, 3)}s);')
+		# compression details
+		summary.append(f'compressed successfully ({round(time() - start_time, 3)}s);')
 
-			if percent_compression_bytes == 0.0:
+		if percent_compression_bytes == 0.0:
 
-				print('- (no compresson found)')
-				return
-			
-			print(f'- size (bytes):    {input_size} -> {output_size} (decreased by {percent_compression_bytes}%)')
-			print(f'- number of chars: {input_len} -> {output_len} (decreased by {percent_compression_chars}%)')
-			print(f'- bytes / char:    {round(input_size / input_len, 2)} -> {round(output_size / output_len, 2)}')
-			print(f'- (lookup table: {lookup_size} bytes, {lookup_len} chars ({lookup_percentage}% of output)')
-			print(f'- (compressed text: {output_size - lookup_size} bytes, {output_len - lookup_len} chars ({round(100 - lookup_percentage, 2)}% of output)')
+			summary.append('- (no compresson found)')
+			return '\n'.join(summary)
+		
+		summary.append(f'- size (bytes):    {input_size} -> {output_size} (decreased by {percent_compression_bytes}%)')
+		summary.append(f'- number of chars: {input_len} -> {output_len} (decreased by {percent_compression_chars}%)')
+		summary.append(f'- bytes / char:    {round(input_size / input_len, 2)} -> {round(output_size / output_len, 2)}')
+		summary.append(f'- (lookup table: {lookup_size} bytes, {lookup_len} chars ({lookup_percentage}% of output)')
+		summary.append(f'- (compressed text: {output_size - lookup_size} bytes, {output_len - lookup_len} chars ({round(100 - lookup_percentage, 2)}% of output)')
+
+		return '\n'.join(summary)
 			
 	def decompress(self, input_folder: str, output_folder: str) -> None:
 
@@ -251,18 +418,20 @@ class LosslessCompressor:
 			- Uses `self.lookup_delimeter` to seperate each key and value pair in the lookup dictionary
 
 			#### Perameters
-			- `output: str` = the raw output from the saved file
+			- `input: str` = the raw input from the saved file
 
 			#### Returns
 			- `tuple[` <br>
 			  `    str,` = compressed text <br>
 			  `    dict[str, str],` = lookup dictionary <br>
-			  `    int` = mode: (0 or 1) - `0` = file size prioritised when compressing; `1` = number of characters prioritised
 			  `]`
 			'''
 
-			lookup = {x[0]: x[1:] for x in input.split(self.text_delimeter)[0].split(self.lookup_delimeter)}
-			text = '\n'.join(input.split(self.text_delimeter)[1:])
+			# splits at the first text delimeter only, so the text is taken as-is rather than split up + rejoined
+			lookup_input, text_delimeter, text = input.partition(self.text_delimeter)
+			if not text_delimeter: return input, {} # nothing was worth replacing, so the file is just the text (see gen_output)
+
+			lookup = {x[0]: x[1:] for x in lookup_input.split(self.lookup_delimeter)}
 
 			return text, lookup
 		
@@ -270,20 +439,23 @@ class LosslessCompressor:
 
 			'''
 			#### Info
-			Takes the raw input, extracts the text an lookup dict, and replaces all compressed chars with their corresponding chunks
+			Replaces all compressed chars in the text with their corresponding chunks, in a single pass over the text
 
 			#### Perameters
-			- `input: str` - the raw input text from the .llc file
+			- `text: str` - the compressed text extracted from the .llc file
+			- `lookup: dict[str, str]` - the lookup dictionary extracted from the .llc file
 
 			#### Returns
 			- `str` - the decompressed text
 			'''
 
-			# works backwards through lookup and replaces all chars with their corresponding chunks 
-			for key, chunk in list(lookup.items())[-1::-1]:
-				text = text.replace(key, chunk)
+			# fully expands each chunk in the order they were added (a chunk can only contain keys added before it), so every key maps straight to its original text
+			translation_table = {}
 
-			return text
+			for key, chunk in lookup.items():
+				translation_table[ord(key)] = chunk.translate(translation_table)
+
+			return text.translate(translation_table)
 		# ------------
 
 		paths_to_decompress = [input_folder + "\\" + path for path in os.listdir(input_folder)]
@@ -313,6 +485,13 @@ class LosslessCompressor:
 			output_len = len(output)
 			output_size = len(output.encode())
 
+			# an empty file decompresses to an empty file (and its % decompression would divide by zero)
+			if not input_len:
+
+				self.save_file(path = output_path, contents = output)
+				print(f'decompressed successfully ({round(time() - start_time, 5)}s);')
+				continue
+
 			percent_decompression_bytes = round(self.percentage_change(mode = 1, original = input_size, new = output_size), 1)
 			percent_decompression_chars = round(self.percentage_change(mode = 1, original = input_len, new = output_len), 1)
 
@@ -338,10 +517,15 @@ class LosslessCompressor:
 		- `str` - the raw contents of the file
 		'''
 
-		if not os.path.isfile(path): raise FileNotFoundError(f'file \'{path}\' not found; please enter a valid file path')
+		# opens the file straight away rather than checking it's a file first
+		try: file = open(path, 'rb', buffering = 1 << 20)
+		except (FileNotFoundError, IsADirectoryError, PermissionError) as error:
+
+			if isinstance(error, PermissionError) and not os.path.isdir(path): raise # a file that really can't be read (Windows raises this for folders too)
+			raise FileNotFoundError(f'file \'{path}\' not found; please enter a valid file path') from None
 
-		file = open(path, 'r', encoding = 'utf-8')
-		contents = file.read()
+		# reads raw bytes through one large buffer and decodes them in one go (binary mode also keeps '\r\n' line endings intact)
+		contents = file.read().decode('utf-8')
 		file.close()
 		return contents
 			
@@ -359,10 +543,10 @@ class LosslessCompressor:
 		- (Nothing)
 		'''
 
-		if not os.path.isdir(os.path.dirname(path)): os.makedirs(os.path.dirname(path)) 
+		os.makedirs(os.path.dirname(path), exist_ok = True)
 		
-		file = open(path, 'w', encoding = 'utf-8')
-		file.write(contents)
+		file = open(path, 'wb', buffering = 1 << 20)
+		file.write(contents.encode('utf-8'))
 		file.close()
 
 	def percentage_change(self, mode: int, original: float, new: float) -> float:
@@ -440,6 +624,8 @@ class Console:
 # main
 def main() -> None:
 
+	freeze_support() # lets the .exe build start the processes compress() runs files in
+
 	# "D:\rohan\OneDrive\Documents\Coding Projects\Python\Python\Lossless Compression Algorithm\input\"
 	# "D:\rohan\OneDrive\Documents\Coding Projects\Python\Python\Lossless Compression Algorithm\output\"
 	#command = Console.input_command()